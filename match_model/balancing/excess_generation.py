@@ -50,7 +50,7 @@ def define_components(mod):
         mod.Enforce_Hourly_Excess_Generation_Limit = Constraint(
             mod.LOAD_ZONES,
             mod.PERIODS,
-            rule=lambda m, z, p: sum(
+            rule=lambda m, z, p: quicksum(
                 m.ZoneTotalExcessGen[z, t] for t in m.TIMEPOINTS if m.tp_period[t] == p
             )
             <= sum(m.zone_demand_mw[z, t] for t in m.TIMEPOINTS if m.tp_period[t] == p)
@@ -66,27 +66,35 @@ def define_components(mod):
 
     if mod.options.goal_type == "hourly":
 
-        mod.ExcessGenPenaltyInTP = Expression(
-            mod.TIMEPOINTS,
-            rule=lambda m, t: sum(
+        def ExcessGenPenaltyInTP_rule(m, t):
+            # skip building the penalty expression when no penalty is set
+            if m.excessgen_penalty[m.tp_period[t]] == 0:
+                return 0.0
+            return sum(
                 m.ZoneTotalExcessGen[z, t] * m.excessgen_penalty[m.tp_period[t]]
                 for z in m.LOAD_ZONES
-            ),
+            )
+
+        mod.ExcessGenPenaltyInTP = Expression(
+            mod.TIMEPOINTS,
+            rule=ExcessGenPenaltyInTP_rule,
             doc="Summarize costs for the objective function",
         )
         mod.Cost_Components_Per_TP.append("ExcessGenPenaltyInTP")
 
     elif mod.options.goal_type == "annual":
         # assign a penalty for any generation in excess of the target
-        mod.ExcessGenPenalty = Expression(
-            mod.PERIODS,
-            rule=lambda m, p: (
+        def ExcessGenPenalty_rule(m, p):
+            # skip building the penalty expression when no penalty is set
+            if m.excessgen_penalty[p] == 0:
+                return 0.0
+            return (
                 m.total_generation_in_period[p]
                 - m.total_storage_losses_in_period[p]
                 - (m.renewable_target[p] * m.total_demand_in_period[p])
-            )
-            * m.excessgen_penalty[p],
-        )
+            ) * m.excessgen_penalty[p]
+
+        mod.ExcessGenPenalty = Expression(mod.PERIODS, rule=ExcessGenPenalty_rule)
         mod.Cost_Components_Per_Period.append("ExcessGenPenalty")
 
 
@@ -65,7 +65,7 @@ def define_components(mod):
     mod.LOAD_ZONES = Set(dimen=1)
     mod.ZONE_TIMEPOINTS = Set(
         dimen=2,
-        initialize=lambda m: m.LOAD_ZONES * m.TIMEPOINTS,
+        initialize=lambda m: [(z, t) for z in m.LOAD_ZONES for t in m.TIMEPOINTS],
         doc="The cross product of load zones and timepoints, used for indexing.",
     )
     mod.zone_demand_mw = Param(mod.ZONE_TIMEPOINTS, within=NonNegativeReals)
@@ -100,14 +100,21 @@ def define_dynamic_components(mod):
     is factored out of the equation for brevity.
     """
 
-    mod.Zone_Energy_Balance = Constraint(
-        mod.ZONE_TIMEPOINTS,
-        rule=lambda m, z, t: (
-            sum(getattr(m, component)[z, t] for component in m.Zone_Power_Injections)
-            == sum(
-                getattr(m, component)[z, t] for component in m.Zone_Power_Withdrawals
+    def Zone_Energy_Balance_rule(m, z, t):
+        # Resolve the dynamic component lists to component objects once,
+        # rather than calling getattr for every (zone, timepoint).
+        if not hasattr(m, "zone_balance_components"):
+            m.zone_balance_components = (
+                [getattr(m, component) for component in m.Zone_Power_Injections],
+                [getattr(m, component) for component in m.Zone_Power_Withdrawals],
             )
-        ),
+        injections, withdrawals = m.zone_balance_components
+        return sum(component[z, t] for component in injections) == sum(
+            component[z, t] for component in withdrawals
+        )
+
+    mod.Zone_Energy_Balance = Constraint(
+        mod.ZONE_TIMEPOINTS, rule=Zone_Energy_Balance_rule
     )
 
 
@@ -71,7 +71,7 @@ def define_components(mod):
     # Calculate the total generation in the period
     mod.total_generation_in_period = Expression(
         mod.PERIODS,
-        rule=lambda m, p: sum(
+        rule=lambda m, p: quicksum(
             m.ZoneTotalGeneratorDispatch[z, t] + m.ZoneTotalExcessGen[z, t]
             for (z, t) in m.ZONE_TIMEPOINTS
             if m.tp_period[t] == p
@@ -82,7 +82,7 @@ def define_components(mod):
     try:
         mod.total_storage_losses_in_period = Expression(
             mod.PERIODS,
-            rule=lambda m, p: sum(
+            rule=lambda m, p: quicksum(
                 m.ZoneTotalStorageCharge[z, t] - m.ZoneTotalStorageDischarge[z, t]
                 for (z, t) in m.ZONE_TIMEPOINTS
                 if m.tp_period[t] == p
@@ -97,7 +97,7 @@ def define_components(mod):
         mod.AnnualSystemPower = Expression(
             mod.LOAD_ZONES,
             mod.PERIODS,
-            rule=lambda m, z, p: sum(m.SystemPower[z, t] for t in m.TIMEPOINTS),
+            rule=lambda m, z, p: quicksum(m.SystemPower[z, t] for t in m.TIMEPOINTS),
         )
 
         mod.Enforce_Hourly_Renewable_Target = Constraint(
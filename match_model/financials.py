@@ -232,27 +232,26 @@ def define_dynamic_components(mod):
 
     """
 
-    def calc_tp_costs_in_period(m, t):
-        return sum(
-            getattr(m, tp_cost)[t] * m.tp_weight_in_year[t]
-            for tp_cost in m.Cost_Components_Per_TP
-        )
-
     # Note: multiply annual costs by a conversion factor if running this
     # model on an intentional subset of annual data whose weights do not
     # add up to a full year: sum(tp_weight_in_year) / hours_per_year
     # This would also require disabling the validate_time_weights check.
-    def calc_annual_costs_in_period(m, p):
-        return sum(
-            getattr(m, annual_cost)[p] for annual_cost in m.Cost_Components_Per_Period
-        )
-
     def calc_sys_costs_per_period(m, p):
+        # Resolve the dynamic cost component lists to component objects
+        # once per period instead of calling getattr for every timepoint.
+        tp_costs = [getattr(m, tp_cost) for tp_cost in m.Cost_Components_Per_TP]
+        annual_costs = [
+            getattr(m, annual_cost) for annual_cost in m.Cost_Components_Per_Period
+        ]
         return (
             # All annual payments in the period
             (
-                calc_annual_costs_in_period(m, p)
-                + sum(calc_tp_costs_in_period(m, t) for t in m.TPS_IN_PERIOD[p])
+                sum(annual_cost[p] for annual_cost in annual_costs)
+                + quicksum(
+                    tp_cost[t] * m.tp_weight_in_year[t]
+                    for t in m.TPS_IN_PERIOD[p]
+                    for tp_cost in tp_costs
+                )
             )
             *
             # Conversion from annual costs to base year
@@ -6,7 +6,10 @@ This takes data from an input excel file and formats into individual csv files f
 """
 import ast
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+import hashlib
+import json
 import pandas as pd
 import pytz
 import numpy as np
@@ -22,6 +25,14 @@ import PySAM.Pvwattsv8 as pv
 import PySAM.TcsmoltenSalt as csp_tower
 import PySAM.Windpower as wind
 
+# pyarrow is optional: when installed, its C++ csv writer is used for
+# the large input files instead of pandas' to_csv
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
 warnings.filterwarnings(
     "ignore", message="Data Validation extension is not supported and will be removed"
 )
@@ -226,16 +237,8 @@ def calculate_levelized_lrmer(
         "HighRECost",
     ]
 
-    # create an empty df to hold all of the levelized lrmers
-    levelized_lrmers = pd.DataFrame(
-        columns=[
-            "cambium_scenario",
-            "cambium_region",
-            "timepoint",
-            "timestamp",
-            "lrmer",
-        ]
-    )
+    # create a list to hold the levelized lrmers for each scenario/region
+    levelized_lrmers = []
 
     # for each scenario, load all years and calculate a levelized value
     for scenario in scenarios:
@@ -300,8 +303,11 @@ def calculate_levelized_lrmer(
                 data=(t for t in dates if ((t.month != 2) | (t.day != 29)))
             )
 
-            # add the data to the dataframe
-            levelized_lrmers = pd.concat([levelized_lrmers, region_data], axis=0)
+            # add the data to the list
+            levelized_lrmers.append(region_data)
+
+    # concat all of the scenario/region data together in a single pass
+    levelized_lrmers = pd.concat(levelized_lrmers, axis=0)
 
     # convert the unit from kgCO2/MWh to the appropriate unit
     unit_conversion = {
@@ -317,14 +323,83 @@ def calculate_levelized_lrmer(
     return levelized_lrmers
 
 
+def round_to_sig_figs(values, figures=6):
+    """
+    Rounds an array of floats to the given number of significant
+    figures, the same precision the "%.6g" float format prints.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponent = np.floor(np.log10(np.abs(values)))
+    # zeros (and any nans or infs) pass through unchanged
+    exponent[~np.isfinite(exponent)] = 0.0
+    scale = 10.0 ** (figures - 1 - exponent)
+    return np.round(values * scale) / scale
+
+
+def write_csv(df, path):
+    """
+    Writes a dataframe to csv without the index, through pyarrow's csv
+    writer when pyarrow is available and pandas' to_csv otherwise.
+
+    Floats are written with 6 significant figures — more than enough for
+    capacity factors, prices, and emission factors — on both paths, so
+    the generated inputs do not depend on whether the optional pyarrow
+    package is installed: the pandas fallback formats with "%.6g" and
+    the pyarrow path rounds the float columns to the same precision
+    before writing. The fallback's line terminator is pinned to '\\n' to
+    match pyarrow and skip OS-specific newline translation.
+    """
+    if pa is None:
+        df.to_csv(path, index=False, float_format="%.6g", lineterminator="\n")
+    else:
+        float_cols = df.select_dtypes(include="float").columns
+        if len(float_cols) > 0:
+            df = df.copy()
+            for col in float_cols:
+                df[col] = round_to_sig_figs(df[col].to_numpy())
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+
+def has_missing_values(df):
+    """
+    Checks a dataframe for missing values one column at a time, stopping
+    at the first column that contains one. Equivalent to
+    df.isnull().values.any() without materializing the boolean mask for
+    the whole frame.
+    """
+    return any(df[col].isna().any() for col in df.columns)
+
+
+def wide_to_long(df, var_name, value_name):
+    """
+    Converts a wide dataframe (8760 rows of timepoint data, one column per
+    zone/node/generator) into the long format written to the input csvs.
+
+    Equivalent to adding a timepoint column and calling df.melt, but the
+    long-form columns are built directly with np.repeat/np.tile on the
+    underlying arrays, which avoids the intermediate melted copy.
+    """
+    n_rows = len(df)
+    return pd.DataFrame(
+        {
+            var_name: np.repeat(df.columns.to_numpy(), n_rows),
+            "timepoint": np.tile(np.arange(1, n_rows + 1), df.shape[1]),
+            value_name: df.to_numpy().ravel(order="F"),
+        }
+    )
+
+
 def generate_inputs(model_workspace):
 
     model_inputs = model_workspace / "model_inputs.xlsx"
 
     print("Setting up model directory...")
     # Load all of the data from the excel file
+    # open the workbook once so that each sheet read below does not
+    # re-parse the entire xlsx file
+    model_inputs = pd.ExcelFile(model_inputs)
 
-    xl_general = pd.read_excel(io=model_inputs, sheet_name="general").dropna(
+    xl_general = pd.read_excel(model_inputs, sheet_name="general").dropna(
         axis=1, how="all"
     )
 
@@ -350,20 +425,21 @@ def generate_inputs(model_workspace):
         / 3600
     )
 
-    xl_options = pd.read_excel(io=model_inputs, sheet_name="solver_options").dropna(
+    xl_options = pd.read_excel(model_inputs, sheet_name="solver_options").dropna(
         axis=1, how="all"
     )
 
     # write options.txt
-    options_txt = open(model_workspace / "options.txt", "w+")
+    option_lines = []
     for index, row in xl_options.iterrows():
         if row["Value"] == "None" or row["Value"] == False or row["Value"] == None:
             pass
         elif row["Value"] == True:
-            options_txt.write(f'--{row["Option"]}\n')
+            option_lines.append(f'--{row["Option"]}')
         else:
-            options_txt.write(f'--{row["Option"]} {row["Value"]}\n')
-    options_txt.close()
+            option_lines.append(f'--{row["Option"]} {row["Value"]}')
+    with open(model_workspace / "options.txt", "w+") as options_txt:
+        options_txt.write("\n".join(option_lines) + "\n")
 
     solver = xl_options.loc[xl_options["Option"] == "solver", "Value"].item().lower()
     if solver == "cbc":
@@ -373,16 +449,13 @@ def generate_inputs(model_workspace):
         shutil.copy("coin-license.txt", model_workspace)
 
     # create the scenario folders in the input and output directories
-    try:
-        os.mkdir(model_workspace / "inputs")
-        os.mkdir(model_workspace / "outputs")
-        os.mkdir(model_workspace / "summary_reports")
-    except FileExistsError:
-        pass
+    os.makedirs(model_workspace / "inputs", exist_ok=True)
+    os.makedirs(model_workspace / "outputs", exist_ok=True)
+    os.makedirs(model_workspace / "summary_reports", exist_ok=True)
 
     # Scenarios
     xl_scenarios = pd.read_excel(
-        io=model_inputs, sheet_name="scenarios", skiprows=1
+        model_inputs, sheet_name="scenarios", skiprows=1
     ).dropna(axis=1, how="all")
 
     # if there are any spaces in the scenario names, replace with underscore
@@ -399,38 +472,30 @@ def generate_inputs(model_workspace):
     )
     unused_modules = list(modules_used[modules_used == 0].index)
 
+    # index the scenarios table by parameter once so the per-scenario
+    # lookups below are hash lookups rather than full-table scans
+    xl_scenarios_by_param = xl_scenarios.set_index("Parameter")
+    scenario_options = xl_scenarios[
+        xl_scenarios["Input_Type"] == "Options"
+    ].set_index("Parameter")
+    scenario_modules = xl_scenarios[
+        xl_scenarios["Input_Type"] == "Optional Modules"
+    ].set_index("Parameter")
+
     # create input and output directories for each scenario
     for scenario in scenario_list:
-        try:
-            os.mkdir(model_workspace / f"inputs/{scenario}")
-        except FileExistsError:
-            pass
-        try:
-            os.mkdir(model_workspace / f"outputs/{scenario}")
-        except FileExistsError:
-            pass
+        os.makedirs(model_workspace / f"inputs/{scenario}", exist_ok=True)
+        os.makedirs(model_workspace / f"outputs/{scenario}", exist_ok=True)
 
     # create scenarios.txt
-    # write scenario configuration to scenarios.txt
-    scenarios = open(model_workspace / "scenarios.txt", "a+")
+    # collect the scenario configuration lines for scenarios.txt
+    scenario_lines = []
     for scenario in scenario_list:
         # get configuration options
-        option_list = list(
-            xl_scenarios.loc[
-                (xl_scenarios["Input_Type"] == "Options")
-                & (xl_scenarios[scenario] != 0),
-                "Parameter",
-            ]
-        )
-        renewable_target_type = xl_scenarios.loc[
-            (xl_scenarios["Parameter"] == "goal_type"), scenario
-        ].item()
-        select_variants = xl_scenarios.loc[
-            (xl_scenarios["Parameter"] == "select_variants"), scenario
-        ].item()
-        excess_generation_limit_type = xl_scenarios.loc[
-            (xl_scenarios["Parameter"] == "excess_generation_limit_type"), scenario
-        ].item()
+        option_list = list(scenario_options.index[scenario_options[scenario] != 0])
+        renewable_target_type = xl_scenarios_by_param.at["goal_type", scenario]
+        select_variants = xl_scenarios_by_param.at["select_variants", scenario]
+        excess_generation_limit_type = xl_scenarios_by_param.at["excess_generation_limit_type", scenario]
 
         if select_variants != 0:
             variant_option = f" --select_variants {select_variants}"
@@ -469,11 +534,11 @@ def generate_inputs(model_workspace):
         else:
             storage_option = ""
 
-        scenarios.write(
+        scenario_lines.append(
             f"--scenario-name {scenario} --outputs-dir outputs/{scenario} --inputs-dir inputs/{scenario}{variant_option}{target_option}{excess_option}{ra_option}{mtr_option}{rec_option}{storage_option}"
         )
-        scenarios.write("\n")
-    scenarios.close()
+    with open(model_workspace / "scenarios.txt", "a+") as scenarios:
+        scenarios.write("\n".join(scenario_lines) + "\n")
 
     print("Loading data from model_inputs.xlsx")
 
@@ -519,12 +584,30 @@ def generate_inputs(model_workspace):
         }
     )
 
+    # timepoints.csv
+    # this frame only depends on the model year, so build it once here
+    # rather than re-running the date formatting for every scenario
+    df_timepoints = pd.DataFrame(
+        index=pd.date_range(
+            start=f"01/01/{year} 00:00", end=f"12/31/{year} 23:00", freq="1H"
+        )
+    )
+    df_timepoints = df_timepoints[
+        ~((df_timepoints.index.month == 2) & (df_timepoints.index.day == 29))
+    ]  # remove leap day if a leap year
+    df_timepoints["timeseries"] = f"{year}_timeseries"
+    df_timepoints["timestamp"] = df_timepoints.index.strftime("%m/%d/%Y %H:%M")
+    df_timepoints["tp_month"] = df_timepoints.index.month
+    df_timepoints["tp_day"] = df_timepoints.index.dayofyear
+    df_timepoints = df_timepoints.reset_index(drop=True)
+    df_timepoints["timepoint_id"] = df_timepoints.index + 1
+
     # Read data from the excel file
 
-    xl_gen = pd.read_excel(io=model_inputs, sheet_name="generators", skiprows=3).dropna(
+    xl_gen = pd.read_excel(model_inputs, sheet_name="generators", skiprows=3).dropna(
         axis=1, how="all"
     )
-    if xl_gen.isnull().values.any():
+    if has_missing_values(xl_gen):
         raise ValueError("The generation tab contains a missing value. Please fix")
     # add default values
     xl_gen["gen_is_storage"] = 0
@@ -543,9 +626,9 @@ def generate_inputs(model_workspace):
         pass
     else:
         xl_storage = pd.read_excel(
-            io=model_inputs, sheet_name="storage", skiprows=3
+            model_inputs, sheet_name="storage", skiprows=3
         ).dropna(axis=1, how="all")
-        if xl_storage.isnull().values.any():
+        if has_missing_values(xl_storage):
             raise ValueError("The storage tab contains a missing value. Please fix")
         # add defaults for storage
         xl_storage["gen_tech"] = "Storage"
@@ -579,9 +662,9 @@ def generate_inputs(model_workspace):
         )
 
     xl_load = pd.read_excel(
-        io=model_inputs, sheet_name="load", header=[1, 2], index_col=0
+        model_inputs, sheet_name="load", header=[1, 2], index_col=0
     ).dropna(axis=1, how="all")
-    if xl_load.isnull().values.any():
+    if has_missing_values(xl_load):
         raise ValueError("Nodal prices contain a missing value. Please check")
 
     if "match_model.optional.resource_adequacy" in unused_modules:
@@ -589,7 +672,7 @@ def generate_inputs(model_workspace):
     else:
         # ra_requirement.csv
         xl_ra_req = pd.read_excel(
-            io=model_inputs, sheet_name="RA_requirements", skiprows=1
+            model_inputs, sheet_name="RA_requirements", skiprows=1
         ).dropna(axis=1, how="all")
         ra_requirement = xl_ra_req.copy()[xl_ra_req["RA_RESOURCE"] != "flexible_RA"]
         ra_requirement["period"] = year
@@ -622,7 +705,7 @@ def generate_inputs(model_workspace):
 
         # ra_capacity_value.csv
         ra_capacity_value = pd.read_excel(
-            io=model_inputs, sheet_name="RA_capacity_value"
+            model_inputs, sheet_name="RA_capacity_value"
         ).dropna(axis=1, how="all")
         ra_capacity_value["period"] = year
         ra_capacity_value = ra_capacity_value[
@@ -631,13 +714,13 @@ def generate_inputs(model_workspace):
 
         # midterm_reliability_requirement.csv
         xl_midterm_ra = pd.read_excel(
-            io=model_inputs, sheet_name="midterm_RA_requirement", skiprows=1
+            model_inputs, sheet_name="midterm_RA_requirement", skiprows=1
         ).dropna(axis=1, how="all")
 
     xl_nodal_prices = pd.read_excel(
-        io=model_inputs, sheet_name="nodal_prices", index_col="Datetime", skiprows=2
+        model_inputs, sheet_name="nodal_prices", index_col="Datetime", skiprows=2
     ).dropna(axis=1, how="all")
-    if xl_nodal_prices.isnull().values.any():
+    if has_missing_values(xl_nodal_prices):
         raise ValueError("Nodal prices contain a missing value. Please check")
     # check that a nodal price exists for each node specified with an MCF in the generation tab
     nodes_to_check = list(xl_gen["gen_pricing_node"].unique())
@@ -650,7 +733,7 @@ def generate_inputs(model_workspace):
             pass
 
     xl_cambium_region = pd.read_excel(
-        io=model_inputs, sheet_name="cambium_region"
+        model_inputs, sheet_name="cambium_region"
     ).dropna(axis=1, how="all")
 
     # get a list of unique cambium regions
@@ -666,17 +749,17 @@ def generate_inputs(model_workspace):
     )
 
     xl_hedge_premium_cost = pd.read_excel(
-        io=model_inputs, sheet_name="hedge_premium_cost", skiprows=2
+        model_inputs, sheet_name="hedge_premium_cost", skiprows=2
     ).dropna(axis=1, how="all")
 
     # rec_value.csv
     xl_rec_value = pd.read_excel(
-        io=model_inputs, sheet_name="rec_value", skiprows=1
+        model_inputs, sheet_name="rec_value", skiprows=1
     ).dropna(axis=1, how="all")
 
     # fixed_costs.csv
     xl_fixed_costs = pd.read_excel(
-        io=model_inputs, sheet_name="fixed_costs", skiprows=1
+        model_inputs, sheet_name="fixed_costs", skiprows=1
     )
 
     # create a dataframe that contains the unique combinations of resource years and generator sets, and the scenarios associated with each
@@ -693,6 +776,29 @@ def generate_inputs(model_workspace):
         vcf_sets.groupby(["years", "gen_set"])["scenario"].apply(list).reset_index()
     )
 
+    # read the manual capacity factor and SAM template sheets once here,
+    # rather than re-parsing them for every gen set in the loop below
+    capacity_factor_inputs = list(xl_gen["capacity_factor_input"].unique())
+    if "manual" in capacity_factor_inputs:
+        xl_manual_vcf = (
+            pd.read_excel(
+                model_inputs,
+                sheet_name="manual_capacity_factors",
+                index_col="Datetime",
+                skiprows=2,
+            )
+            .dropna(axis=1, how="all")
+            .reset_index(drop=True)
+        )
+        if has_missing_values(xl_manual_vcf):
+            raise ValueError(
+                "The manual_capacity_factor tab contains a missing value. Please fix"
+            )
+    if "SAM" in capacity_factor_inputs:
+        xl_sam_templates = pd.read_excel(
+            model_inputs, sheet_name="SAM_templates"
+        ).dropna(axis=1, how="all")
+
     # for each of these unique combinations, get the variable capacity factor data
     for index, row in vcf_sets.iterrows():
         gen_set = row["gen_set"]
@@ -719,26 +825,13 @@ def generate_inputs(model_workspace):
 
         vcf_input_types = list(vcf_inputs.capacity_factor_input.unique())
 
-        # create a blank dataframe with a datetimeindex for variable capacity factors
-        df_vcf = pd.DataFrame(data=range(1, 8761), columns=["timepoint"]).set_index(
-            "timepoint"
-        )
+        # the pieces of variable capacity factor data are collected here
+        # and combined in a single concat, rather than growing df_vcf
+        # with a merge per piece
+        vcf_parts = []
 
         if "manual" in vcf_input_types:
-            manual_vcf = (
-                pd.read_excel(
-                    io=model_inputs,
-                    sheet_name="manual_capacity_factors",
-                    index_col="Datetime",
-                    skiprows=2,
-                )
-                .dropna(axis=1, how="all")
-                .reset_index(drop=True)
-            )
-            if manual_vcf.isnull().values.any():
-                raise ValueError(
-                    "The manual_capacity_factor tab contains a missing value. Please fix"
-                )
+            manual_vcf = xl_manual_vcf.copy()
             # check that a capacity factor exists for each generator specified with an MCF in the generation tab
             manual_gens = list(
                 set_gens.loc[
@@ -757,16 +850,12 @@ def generate_inputs(model_workspace):
             manual_vcf["timepoint"] = manual_vcf.index + 1
             manual_vcf = manual_vcf.set_index("timepoint")
 
-            # merge manual vcf into df
-            df_vcf = df_vcf.merge(
-                manual_vcf, how="left", left_index=True, right_index=True
-            )
+            # add the manual vcf data to the list
+            vcf_parts.append(manual_vcf)
 
         if "SAM" in vcf_input_types:
             # get SAM template data
-            sam_templates = pd.read_excel(
-                io=model_inputs, sheet_name="SAM_templates"
-            ).dropna(axis=1, how="all")
+            sam_templates = xl_sam_templates
 
             # get the information for the relevant generators
             sam_inputs = vcf_inputs[vcf_inputs["capacity_factor_input"] == "SAM"]
@@ -786,13 +875,10 @@ def generate_inputs(model_workspace):
                 gen_inputs = vcf_inputs.copy()[vcf_inputs["SAM_template"] == template]
 
                 # get lat/long coordinates of all resources using this template
-                gen_inputs["long/lat"] = gen_inputs.apply(
-                    lambda row: f"({row.longitude},{row.latitude})", axis=1
-                )
-                gen_inputs["long/lat"] = gen_inputs["long/lat"].apply(ast.literal_eval)
                 resource_dict = defaultdict(list)
                 zipped_list = zip(
-                    gen_inputs["long/lat"], gen_inputs["GENERATION_PROJECT"]
+                    zip(gen_inputs["longitude"], gen_inputs["latitude"]),
+                    gen_inputs["GENERATION_PROJECT"],
                 )
                 for key, value in zipped_list:
                     resource_dict[key].append(value)
@@ -809,13 +895,23 @@ def generate_inputs(model_workspace):
                     parameters = resource_template.loc[
                         resource_template["Group"] == group, ["Parameter", "Value"]
                     ]
+                    # batch-parse the numeric values in one pass; only
+                    # the residual non-numeric entries (tuples, strings)
+                    # go through ast.literal_eval one at a time
+                    numeric_values = pd.to_numeric(
+                        parameters["Value"], errors="coerce"
+                    )
                     parameter_dict = {}
-                    for index, row in parameters.iterrows():
-                        try:
-                            parameter_dict[row.Parameter] = ast.literal_eval(row.Value)
-                        except ValueError:
-                            parameter_dict[row.Parameter] = row.Value
-                    # dict(zip(parameters.Parameter, ast.literal_eval(parameters.Value)))
+                    for param, value, numeric in zip(
+                        parameters["Parameter"], parameters["Value"], numeric_values
+                    ):
+                        if pd.notna(numeric):
+                            parameter_dict[param] = numeric.item()
+                        else:
+                            try:
+                                parameter_dict[param] = ast.literal_eval(value)
+                            except ValueError:
+                                parameter_dict[param] = value
 
                     config_dict[group] = parameter_dict
 
@@ -836,10 +932,8 @@ def generate_inputs(model_workspace):
                         tz_offset,
                     )
 
-                    # add the data to the dataframe
-                    df_vcf = df_vcf.merge(
-                        solar_vcf, how="left", left_index=True, right_index=True
-                    )
+                    # add the data to the list
+                    vcf_parts.append(solar_vcf)
 
                 elif sam_function == "csp_tower":
                     # run PySAM to simulate the solar outputs
@@ -853,10 +947,8 @@ def generate_inputs(model_workspace):
                         tz_offset,
                     )
 
-                    # add the data to the dataframe
-                    df_vcf = df_vcf.merge(
-                        csp_vcf, how="left", left_index=True, right_index=True
-                    )
+                    # add the data to the list
+                    vcf_parts.append(csp_vcf)
 
                 elif sam_function == "windpower":
                     # run PySAM to simulate the solar outputs
@@ -870,10 +962,8 @@ def generate_inputs(model_workspace):
                         tz_offset,
                     )
 
-                    # add the data to the dataframe
-                    df_vcf = df_vcf.merge(
-                        wind_vcf, how="left", left_index=True, right_index=True
-                    )
+                    # add the data to the list
+                    vcf_parts.append(wind_vcf)
                 else:
 
                     class UnrecognizedSAMModule(Exception):
@@ -883,6 +973,11 @@ def generate_inputs(model_workspace):
                         f" The {sam_function} SAM module is not configured to work with MATCH. Must be either 'windpower' or 'Pvwattsv8'"
                     )
 
+        # combine all of the capacity factor data; each piece shares the
+        # same 8760-timepoint index, so a single concat aligns them all
+        df_vcf = pd.concat(vcf_parts, axis=1)
+
+        if "SAM" in vcf_input_types:
             for vcf_year in resource_years:
                 if os.path.exists(
                     model_workspace
@@ -903,17 +998,32 @@ def generate_inputs(model_workspace):
                     df_vcf_year.to_csv(
                         model_workspace
                         / gen_set
-                        / f"{vcf_year}_variable_capacity_factors.csv"
+                        / f"{vcf_year}_variable_capacity_factors.csv",
+                        float_format="%.6g",
+                        lineterminator="\n",
                     )
 
         # remove year from column name
-        df_vcf.columns = [i.split("~")[0] for i in df_vcf.columns]
-
-        # average all of the resource years together for each resource
-        df_vcf = df_vcf.groupby(df_vcf.columns, axis=1).mean()
-
-        # replace all negative capacity factors with 0
-        df_vcf[df_vcf < 0] = 0
+        resource_names = np.asarray([i.split("~")[0] for i in df_vcf.columns])
+
+        # average all of the resource years together for each resource.
+        # A label-based groupby along axis=1 hashes the column names for
+        # every group, so instead map each column to an integer resource
+        # code and reduce the underlying array directly with numpy
+        codes, uniques = pd.factorize(resource_names, sort=True)
+        # to_numpy can hand back a column-major view of the frame's
+        # internal block, which makes the row-wise reduction below walk
+        # memory with an 8760-element stride; normalize to C order first
+        vcf_values = np.ascontiguousarray(df_vcf.to_numpy())
+        order = np.argsort(codes, kind="stable")
+        starts = np.searchsorted(codes[order], np.arange(len(uniques)))
+        vcf_means = np.add.reduceat(vcf_values[:, order], starts, axis=1)
+        vcf_means /= np.bincount(codes)
+
+        # replace all negative capacity factors with 0, clipping the
+        # underlying array in place rather than building a boolean mask
+        np.clip(vcf_means, 0, None, out=vcf_means)
+        df_vcf = pd.DataFrame(vcf_means, index=df_vcf.index, columns=uniques)
 
         df_vcf = df_vcf.reset_index()
 
@@ -929,6 +1039,18 @@ def generate_inputs(model_workspace):
             lrmer_data["cambium_region"].isin(set_cambium_region_list), :
         ]
 
+        # write the large csv files from a small thread pool so that
+        # formatting one file overlaps disk I/O for the others; the
+        # writes are joined after the last scenario in the set
+        csv_writer_pool = ThreadPoolExecutor(max_workers=4)
+        csv_futures = []
+
+        # the capacity factor data depends only on the gen set, so it is
+        # written for the first scenario in the set and hardlinked into
+        # the input directories of the remaining scenarios
+        vcf_source = None
+        bcf_source = None
+
         # iterate for each scenario and save outputs to csv files
         for scenario in set_scenario_list:
 
@@ -946,13 +1068,7 @@ def generate_inputs(model_workspace):
                 "match_model.generators.build",
                 "match_model.generators.dispatch",
             ]
-            module_list = list(
-                xl_scenarios.loc[
-                    (xl_scenarios["Input_Type"] == "Optional Modules")
-                    & (xl_scenarios[scenario] == 1),
-                    "Parameter",
-                ]
-            )
+            module_list = list(scenario_modules.index[scenario_modules[scenario] == 1])
             if "match_model.optional.wholesale_pricing" in module_list:
                 module_list.remove("match_model.optional.wholesale_pricing")
                 required_module_list.append("match_model.optional.wholesale_pricing")
@@ -969,37 +1085,22 @@ def generate_inputs(model_workspace):
                 + module_list
                 + ["match_model.reporting.generate_report"]
             )
-            modules = open(input_dir / "modules.txt", "w+")
-            for module in module_list:
-                modules.write(module)
-                modules.write("\n")
-            modules.close()
+            with open(input_dir / "modules.txt", "w+") as modules:
+                modules.write("\n".join(module_list) + "\n")
 
             # renewable_target.csv
-            renewable_target_value = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "renewable_target"), scenario
-            ].item()
-            renewable_target_type = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "goal_type"), scenario
-            ].item()
-            select_variants = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "select_variants"), scenario
-            ].item()
+            renewable_target_value = xl_scenarios_by_param.at["renewable_target", scenario]
+            renewable_target_type = xl_scenarios_by_param.at["goal_type", scenario]
+            select_variants = xl_scenarios_by_param.at["select_variants", scenario]
             renewable_target = pd.DataFrame(
                 data={"period": [year], "renewable_target": [renewable_target_value]}
             )
             renewable_target.to_csv(input_dir / "renewable_target.csv", index=False)
 
             # excessgen_penalty.csv
-            excessgen_penalty = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "excessgen_penalty"), scenario
-            ].item()
-            excess_generation_limit = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "excess_generation_limit"), scenario
-            ].item()
-            excess_generation_limit_type = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "excess_generation_limit_type"), scenario
-            ].item()
+            excessgen_penalty = xl_scenarios_by_param.at["excessgen_penalty", scenario]
+            excess_generation_limit = xl_scenarios_by_param.at["excess_generation_limit", scenario]
+            excess_generation_limit_type = xl_scenarios_by_param.at["excess_generation_limit_type", scenario]
             excessgen_penalty = pd.DataFrame(
                 data={
                     "period": [year],
@@ -1010,12 +1111,14 @@ def generate_inputs(model_workspace):
             excessgen_penalty.to_csv(input_dir / "excessgen_limits.csv", index=False)
 
             # save lrmer data for summary reports
-            lrmer_for_gen_set.to_csv(input_dir / "lrmer_for_summary.csv", index=False)
+            csv_futures.append(
+                csv_writer_pool.submit(
+                    write_csv, lrmer_for_gen_set, input_dir / "lrmer_for_summary.csv"
+                )
+            )
 
             # load scenario name to use
-            cambium_scenario = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "cambium_scenario"), scenario
-            ].item()
+            cambium_scenario = xl_scenarios_by_param.at["cambium_scenario", scenario]
             # write the name of the cambium scenario to a text file
             cambium_scenario_file = open(input_dir / "cambium_scenario.txt", "w+")
             cambium_scenario_file.write(cambium_scenario)
@@ -1024,9 +1127,7 @@ def generate_inputs(model_workspace):
             # if emissions optimization module in use, generate inputs for module
             if "match_model.optional.emissions_optimization" in module_list:
                 # social cost of carbon
-                internal_carbon_price = xl_scenarios.loc[
-                    (xl_scenarios["Parameter"] == "internal_carbon_price"), scenario
-                ].item()
+                internal_carbon_price = xl_scenarios_by_param.at["internal_carbon_price", scenario]
                 internal_carbon_price = pd.DataFrame(
                     data={
                         "period": [year],
@@ -1050,6 +1151,9 @@ def generate_inputs(model_workspace):
                 cambium_regions.to_csv(input_dir / "cambium_regions.csv", index=False)
 
             # summary_report.ipynb
+            # each scenario needs its own copy of the notebook (not a
+            # hardlink): generate_report executes it with nbconvert
+            # --inplace, which would rewrite a shared inode
             shutil.copy("../reporting/summary_report.ipynb", input_dir)
 
             # generator set name
@@ -1061,29 +1165,9 @@ def generate_inputs(model_workspace):
             df_timeseries.to_csv(input_dir / "timeseries.csv", index=False)
 
             # get configuration options
-            option_list = list(
-                xl_scenarios.loc[
-                    (xl_scenarios["Input_Type"] == "Options")
-                    & (xl_scenarios[scenario] != 0),
-                    "Parameter",
-                ]
-            )
+            option_list = list(scenario_options.index[scenario_options[scenario] != 0])
 
             # timepoints.csv
-            df_timepoints = pd.DataFrame(
-                index=pd.date_range(
-                    start=f"01/01/{year} 00:00", end=f"12/31/{year} 23:00", freq="1H"
-                )
-            )
-            df_timepoints = df_timepoints[
-                ~((df_timepoints.index.month == 2) & (df_timepoints.index.day == 29))
-            ]  # remove leap day if a leap year
-            df_timepoints["timeseries"] = f"{year}_timeseries"
-            df_timepoints["timestamp"] = df_timepoints.index.strftime("%m/%d/%Y %H:%M")
-            df_timepoints["tp_month"] = df_timepoints.index.month
-            df_timepoints["tp_day"] = df_timepoints.index.dayofyear
-            df_timepoints = df_timepoints.reset_index(drop=True)
-            df_timepoints["timepoint_id"] = df_timepoints.index + 1
             df_timepoints.to_csv(input_dir / "timepoints.csv", index=False)
 
             df_financials.to_csv(input_dir / "financials.csv", index=False)
@@ -1199,9 +1283,7 @@ def generate_inputs(model_workspace):
             load_zones.to_csv(input_dir / "load_zones.csv", index=False)
 
             # get the load type that should be used
-            load_scenario = xl_scenarios.loc[
-                (xl_scenarios["Parameter"] == "load_scenario"), scenario
-            ].item()
+            load_scenario = xl_scenarios_by_param.at["load_scenario", scenario]
 
             loads = xl_load.iloc[
                 :, xl_load.columns.get_level_values(0) == load_scenario
@@ -1209,12 +1291,10 @@ def generate_inputs(model_workspace):
             loads.columns = loads.columns.droplevel()
 
             loads = loads.reset_index(drop=True)
-            loads["timepoint"] = loads.index + 1
-            loads = loads.melt(
-                id_vars=["timepoint"], var_name="load_zone", value_name="zone_demand_mw"
+            loads = wide_to_long(loads, "load_zone", "zone_demand_mw")
+            csv_futures.append(
+                csv_writer_pool.submit(write_csv, loads, input_dir / "loads.csv")
             )
-            loads = loads[["load_zone", "timepoint", "zone_demand_mw"]]
-            loads.to_csv(input_dir / "loads.csv", index=False)
 
             # get the name of the load zone
             load_zone_name = load_list[0]
@@ -1260,18 +1340,22 @@ def generate_inputs(model_workspace):
             pricing_nodes.to_csv(input_dir / "pricing_nodes.csv", index=False)
 
             # nodal_prices.csv
-            nodal_prices = xl_nodal_prices.reset_index(drop=True)
-            nodal_prices = nodal_prices.astype(float)
-            nodal_prices = nodal_prices[node_list]
-            nodal_prices["timepoint"] = nodal_prices.index + 1
-            nodal_prices = nodal_prices.melt(
-                id_vars=["timepoint"], var_name="pricing_node", value_name="nodal_price"
+            # pull the relevant node columns into a single float array and
+            # round to the nearest whole cent in place, then go straight
+            # to long form without the intermediate frame copies
+            nodal_price_values = xl_nodal_prices[node_list].to_numpy(dtype=float)
+            np.round(nodal_price_values, 2, out=nodal_price_values)
+            nodal_prices = wide_to_long(
+                pd.DataFrame(nodal_price_values, columns=node_list),
+                "pricing_node",
+                "nodal_price",
             )
-            nodal_prices = nodal_prices[["pricing_node", "timepoint", "nodal_price"]]
-            # round all nodal prices to the nearest whole cent
-            nodal_prices["nodal_price"] = nodal_prices["nodal_price"].round(2)
             # add system power / demand node prices to df
-            nodal_prices.to_csv(input_dir / "nodal_prices.csv", index=False)
+            csv_futures.append(
+                csv_writer_pool.submit(
+                    write_csv, nodal_prices, input_dir / "nodal_prices.csv"
+                )
+            )
 
             # hedge_cost.csv
             if not xl_hedge_premium_cost.empty:
@@ -1351,80 +1435,92 @@ def generate_inputs(model_workspace):
             hedge_cost.to_csv(input_dir / "hedge_premium_cost.csv", index=False)
 
             # variable_capacity_factors.csv
-            df_vcf_scenario = df_vcf.copy()
-
-            # melt the data and save as csv
-            df_vcf_scenario = df_vcf_scenario.melt(
-                id_vars="timepoint",
-                var_name="GENERATION_PROJECT",
-                value_name="variable_capacity_factor",
-            )
-
-            # reorder the columns
-            df_vcf_scenario = df_vcf_scenario[
-                ["GENERATION_PROJECT", "timepoint", "variable_capacity_factor"]
-            ]
+            if vcf_source is None:
+                # pivot the wide capacity factor data to long form
+                df_vcf_scenario = wide_to_long(
+                    df_vcf.drop(columns="timepoint"),
+                    "GENERATION_PROJECT",
+                    "variable_capacity_factor",
+                )
 
-            # split any baseload generators into a separate capacity factor dataframe
-            df_bcf_scenario = df_vcf_scenario.copy()
-            # get a list of all baseload generation projects
-            baseload_list = generation_projects_info.loc[
-                generation_projects_info["gen_is_baseload"] == 1, "GENERATION_PROJECT"
-            ].tolist()
-            # keep baseload generators
-            df_bcf_scenario = df_bcf_scenario[
-                df_bcf_scenario["GENERATION_PROJECT"].isin(baseload_list)
-            ]
-            # change param name
-            df_bcf_scenario = df_bcf_scenario.rename(
-                columns={"variable_capacity_factor": "baseload_capacity_factor"}
-            )
-            # drop baseload generators from vcf dataframe
-            df_vcf_scenario = df_vcf_scenario[
-                ~df_vcf_scenario["GENERATION_PROJECT"].isin(baseload_list)
-            ]
+                # split any baseload generators into a separate capacity factor dataframe
+                df_bcf_scenario = df_vcf_scenario.copy()
+                # get a list of all baseload generation projects
+                baseload_list = generation_projects_info.loc[
+                    generation_projects_info["gen_is_baseload"] == 1,
+                    "GENERATION_PROJECT",
+                ].tolist()
+                # keep baseload generators
+                df_bcf_scenario = df_bcf_scenario[
+                    df_bcf_scenario["GENERATION_PROJECT"].isin(baseload_list)
+                ]
+                # change param name
+                df_bcf_scenario = df_bcf_scenario.rename(
+                    columns={"variable_capacity_factor": "baseload_capacity_factor"}
+                )
+                # drop baseload generators from vcf dataframe
+                df_vcf_scenario = df_vcf_scenario[
+                    ~df_vcf_scenario["GENERATION_PROJECT"].isin(baseload_list)
+                ]
 
-            # add a curtailment capacity factor
-            # merge in the pricing node
-            df_vcf_scenario = df_vcf_scenario.merge(
-                generation_projects_info[["GENERATION_PROJECT", "gen_pricing_node"]],
-                how="left",
-                on="GENERATION_PROJECT",
-                validate="m:1",
-            ).rename(columns={"gen_pricing_node": "pricing_node"})
-            # merge in the price
-            df_vcf_scenario = df_vcf_scenario.merge(
-                nodal_prices,
-                how="left",
-                on=["pricing_node", "timepoint"],
-                validate="m:1",
-            )
-            # create a binary variable if the price is negative or zero
-            df_vcf_scenario = df_vcf_scenario.assign(
-                negative_price=lambda x: np.where((x.nodal_price <= 0), 1, 0)
-            )
-            # create the curtailment capacity factor colunn
-            df_vcf_scenario["curtailment_capacity_factor"] = (
-                df_vcf_scenario["variable_capacity_factor"]
-                * df_vcf_scenario["negative_price"]
-            )
-            # ensure the capacity factor is greater than zero
-            df_vcf_scenario.loc[
-                df_vcf_scenario["curtailment_capacity_factor"] < 0,
-                "curtailment_capacity_factor",
-            ] = 0
-            # remove intermediate columns
-            df_vcf_scenario = df_vcf_scenario.drop(
-                columns=["pricing_node", "nodal_price", "negative_price"]
-            )
+                # add a curtailment capacity factor
+                # merge in the pricing node
+                df_vcf_scenario = df_vcf_scenario.merge(
+                    generation_projects_info[
+                        ["GENERATION_PROJECT", "gen_pricing_node"]
+                    ],
+                    how="left",
+                    on="GENERATION_PROJECT",
+                    validate="m:1",
+                ).rename(columns={"gen_pricing_node": "pricing_node"})
+                # merge in the price
+                df_vcf_scenario = df_vcf_scenario.merge(
+                    nodal_prices,
+                    how="left",
+                    on=["pricing_node", "timepoint"],
+                    validate="m:1",
+                )
+                # create a binary variable if the price is negative or zero
+                df_vcf_scenario = df_vcf_scenario.assign(
+                    negative_price=lambda x: np.where((x.nodal_price <= 0), 1, 0)
+                )
+                # create the curtailment capacity factor colunn
+                df_vcf_scenario["curtailment_capacity_factor"] = (
+                    df_vcf_scenario["variable_capacity_factor"]
+                    * df_vcf_scenario["negative_price"]
+                )
+                # ensure the capacity factor is greater than zero
+                df_vcf_scenario.loc[
+                    df_vcf_scenario["curtailment_capacity_factor"] < 0,
+                    "curtailment_capacity_factor",
+                ] = 0
+                # remove intermediate columns
+                df_vcf_scenario = df_vcf_scenario.drop(
+                    columns=["pricing_node", "nodal_price", "negative_price"]
+                )
 
-            # save data to csv
-            df_vcf_scenario.to_csv(
-                input_dir / "variable_capacity_factors.csv", index=False
-            )
-            df_bcf_scenario.to_csv(
-                input_dir / "baseload_capacity_factors.csv", index=False
-            )
+                # save data to csv; these writes stay synchronous so the
+                # files exist when later scenarios hardlink to them
+                vcf_source = input_dir / "variable_capacity_factors.csv"
+                bcf_source = input_dir / "baseload_capacity_factors.csv"
+                write_csv(df_vcf_scenario, vcf_source)
+                write_csv(df_bcf_scenario, bcf_source)
+            else:
+                # the data was already serialized for the first scenario
+                # in this set, so link to it instead of re-writing it
+                for source in [vcf_source, bcf_source]:
+                    target = input_dir / source.name
+                    if os.path.exists(target):
+                        os.remove(target)
+                    try:
+                        os.link(source, target)
+                    except OSError:
+                        shutil.copyfile(source, target)
+
+        # wait for the queued csv writes to finish and surface any errors
+        for future in csv_futures:
+            future.result()
+        csv_writer_pool.shutdown()
 
     # write the inputs version once all inputs have been successfully generated
     # Get the version number. Strategy #3 from https://packaging.python.org/single_source_version/
@@ -1440,6 +1536,65 @@ def generate_inputs(model_workspace):
     inputs_version.close()
 
 
+def simulation_cache_path(cache_dir, resource_file, config):
+    """
+    Returns the path where the simulated generation profile for this
+    resource file and model configuration is cached.
+
+    SAM simulations are deterministic given the weather file and the
+    model configuration, so repeat runs can load the saved output
+    instead of re-executing the model. The cache key covers the config,
+    the resource file path, and the file's modification time, so
+    changing any of them invalidates the cached entry.
+    """
+    resource_file = str(resource_file)
+    key = hashlib.sha256(
+        json.dumps(
+            {
+                "config": config,
+                "resource_file": resource_file,
+                "mtime": os.path.getmtime(resource_file),
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()
+    return os.path.join(cache_dir, f"{key}.npy")
+
+
+def simulate_solar_site(resource_file, systemDesign, tz_offset):
+    """
+    Simulates solar generation for a single resource file and returns
+    the hourly capacity factors.
+
+    This runs in a worker process: PySAM models are not picklable, so
+    each worker constructs its own model from the system design dict.
+    """
+    # initiate the default PV setup
+    system_model_PV = pv.default("PVWattsNone")
+
+    # assign the non-default system design specs to the model
+    system_model_PV.SystemDesign.assign(systemDesign)
+
+    # assign the solar resource input file to the model
+    system_model_PV.SolarResource.solar_resource_data = tools.SAM_CSV_to_solar_data(
+        resource_file
+    )
+
+    # execute the system model
+    system_model_PV.execute()
+
+    # access sytem power generated output
+    output = np.asarray(system_model_PV.Outputs.gen)
+
+    # roll the data to get into pacific time
+    roll = int(tz_offset - system_model_PV.Outputs.tz)
+    output = np.roll(output, roll)
+
+    # calculate capacity factor by dividing generation by the nameplate AC capacity
+    return output / (systemDesign["system_capacity"] / systemDesign["dc_ac_ratio"])
+
+
 def simulate_solar_generation(
     nrel_api_key,
     nrel_api_email,
@@ -1450,22 +1605,20 @@ def simulate_solar_generation(
     tz_offset,
 ):
 
-    # initiate the default PV setup
-    system_model_PV = pv.default("PVWattsNone")
-
     # specify non-default system design factors
     systemDesign = config_dict["SystemDesign"]
 
-    # assign the non-default system design specs to the model
-    system_model_PV.SystemDesign.assign(systemDesign)
-
     lon_lats = list(resource_dict.keys())
 
-    # this is the df that will hold all of the data for all years
-    df_resource = pd.DataFrame(data=range(1, 8761), columns=["timepoint"]).set_index(
-        "timepoint"
-    )
-    df_index = df_resource.index
+    # these are the columns of capacity factor data for all years, keyed
+    # by "<generator>~<year>"; collecting plain arrays and building the
+    # dataframe once at the end avoids a merge per site per year
+    resource_columns = {}
+
+    # cached simulation outputs are shared across gen sets, like the
+    # weather files themselves
+    cache_dir = input_dir.parent / "PySAM Simulation Cache"
+    os.makedirs(cache_dir, exist_ok=True)
 
     for year in resource_years:
 
@@ -1475,12 +1628,16 @@ def simulate_solar_generation(
 
         nsrdbfetcher = tools.FetchResourceFiles(
             tech="solar",
-            workers=4,  # thread workers if fetching multiple files
+            # one thread worker per site (capped) so the HTTP requests to
+            # the NSRDB/WTK API run concurrently
+            workers=min(len(lon_lats), 16),
             nrel_api_key=nrel_api_key,
             resource_type="psm3",
             resource_year=str(year),
             nrel_api_email=nrel_api_email,
-            resource_dir=(input_dir / "PySAM Downloaded Weather Files/PV"),
+            # keep the weather file cache at the workspace level so the
+            # same site/year is never re-downloaded for another gen set
+            resource_dir=(input_dir.parent / "PySAM Downloaded Weather Files/PV"),
             verbose=False,
         )
 
@@ -1490,79 +1647,94 @@ def simulate_solar_generation(
         # get a dictionary of all of the filepaths
         nsrdb_path_dict = nsrdbfetcher.resource_file_paths_dict
 
-        for filename in nsrdb_path_dict:
-            solarResource = tools.SAM_CSV_to_solar_data(nsrdb_path_dict[filename])
-
-            # assign the solar resource input file to the model
-            system_model_PV.SolarResource.solar_resource_data = solarResource
-
-            # execute the system model
-            system_model_PV.execute()
+        # the sites are independent, so simulate them in parallel worker
+        # processes; each worker builds its own PySAM model. Sites with
+        # a cached result from an earlier run are loaded from disk
+        # instead of being re-simulated
+        site_outputs = {}
+        with ProcessPoolExecutor() as site_pool:
+            site_futures = {}
+            for filename in nsrdb_path_dict:
+                cache_path = simulation_cache_path(
+                    cache_dir,
+                    nsrdb_path_dict[filename],
+                    {"SystemDesign": systemDesign, "tz_offset": tz_offset},
+                )
+                if os.path.exists(cache_path):
+                    site_outputs[filename] = np.load(cache_path)
+                    continue
+                site_futures[filename] = (
+                    cache_path,
+                    site_pool.submit(
+                        simulate_solar_site,
+                        nsrdb_path_dict[filename],
+                        systemDesign,
+                        tz_offset,
+                    ),
+                )
 
-            # access sytem power generated output
-            output = system_model_PV.Outputs.gen
-            df_output = pd.DataFrame(output)
+            for filename, (cache_path, future) in site_futures.items():
+                output = future.result()
+                np.save(cache_path, output)
+                site_outputs[filename] = output
 
-            # roll the data to get into pacific time
-            roll = int(tz_offset - system_model_PV.Outputs.tz)
-            df_output = pd.DataFrame(np.roll(df_output, roll))
+            for filename, output in site_outputs.items():
 
-            # calculate capacity factor by dividing generation by the nameplate AC capacity
-            df_output = df_output / (
-                systemDesign["system_capacity"] / systemDesign["dc_ac_ratio"]
-            )
+                # name the column based on resource name
+                # check if the resource name is a list, meaning the profile belongs to several resources
+                if isinstance(resource_dict[filename], list):
+                    for gen in resource_dict[filename]:
+                        resource_columns[f"{gen}~{year}"] = output
+                else:
+                    resource_columns[f"{resource_dict[filename]}~{year}"] = output
 
-            # name the column based on resource name
-            # check if the resource name is a list, meaning the profile belongs to several resources
-            if isinstance(resource_dict[filename], list):
-                # merge each resource
-                for gen in resource_dict[filename]:
-                    df_output_gen = df_output.copy().rename(
-                        columns={0: f"{gen}~{year}"}
-                    )
+    # build the dataframe holding all of the data for all years
+    df_resource = pd.DataFrame(
+        resource_columns, index=pd.RangeIndex(1, 8761, name="timepoint")
+    )
 
-                    # merge into the resource
-                    df_output_gen.index = df_index
-                    df_resource = df_resource.merge(
-                        df_output_gen, how="left", left_index=True, right_index=True
-                    )
-            else:
-                df_output = df_output.rename(
-                    columns={0: f"{resource_dict[filename]}~{year}"}
-                )
+    return df_resource
 
-                # merge into the resource
-                df_output.index = df_index
-                df_resource = df_resource.merge(
-                    df_output, how="left", left_index=True, right_index=True
-                )
 
-    # remove year from column name
-    # df_resource.columns = [i.split('~')[0] for i in df_resource.columns]
+def default_powercurve_value(dict, key):
+    """
+    Checks if user provided value, otherwise returns default value
+    """
+    try:
+        return dict[key]
+    except KeyError:
+        if key == "elevation":
+            return 0
+        elif key == "max_cp":
+            return 0.45
+        elif key == "max_tip_speed":
+            return 80
+        elif key == "max_tip_sp_ratio":
+            return 8
+        elif key == "drive_train":
+            return 0
+        else:
 
-    # groupby column name
-    # df_resource = df_resource.groupby(df_resource.columns, axis=1).mean()
+            class MissingData(Exception):
+                pass
 
-    return df_resource
+            raise MissingData(f"missing required input for power curve: {key}")
 
 
-def simulate_wind_generation(
-    nrel_api_key,
-    nrel_api_email,
-    resource_dict,
-    config_dict,
-    resource_years,
-    input_dir,
-    tz_offset,
-):
+def simulate_wind_site(resource_file, config_dict):
+    """
+    Simulates wind generation for a single resource file and returns the
+    hourly capacity factors.
 
+    This runs in a worker process: PySAM models are not picklable, so
+    each worker constructs its own model from the template config dicts.
+    """
     # initiate the default wind power model
     system_model_wind = wind.default("WindPowerNone")
 
     # specify non-default system design factors
     turbine = config_dict["Turbine"]
     farm = config_dict["Farm"]
-    resource = config_dict["Resource"]
 
     if "Losses" in config_dict:
         losses = config_dict["Losses"]
@@ -1572,30 +1744,6 @@ def simulate_wind_generation(
     system_model_wind.Turbine.assign(turbine)
     system_model_wind.Farm.assign(farm)
 
-    def default_powercurve_value(dict, key):
-        """
-        Checks if user provided value, otherwise returns default value
-        """
-        try:
-            return dict[key]
-        except KeyError:
-            if key == "elevation":
-                return 0
-            elif key == "max_cp":
-                return 0.45
-            elif key == "max_tip_speed":
-                return 80
-            elif key == "max_tip_sp_ratio":
-                return 8
-            elif key == "drive_train":
-                return 0
-            else:
-
-                class MissingData(Exception):
-                    pass
-
-                raise MissingData(f"missing required input for power curve: {key}")
-
     # calculate the powercurve if power curve parameters are specified
     if "Powercurve" in config_dict:
         powercurve = config_dict["Powercurve"]
@@ -1611,25 +1759,56 @@ def simulate_wind_generation(
             drive_train=int(default_powercurve_value(powercurve, "drive_train")),
         )
 
+    # assign the wind resource input data to the model
+    system_model_wind.Resource.wind_resource_data = tools.SRW_to_wind_data(
+        resource_file
+    )
+
+    # execute the system model
+    system_model_wind.execute()
+
+    # access sytem power generated output and calculate capacity factor
+    return np.asarray(system_model_wind.Outputs.gen) / farm["system_capacity"]
+
+
+def simulate_wind_generation(
+    nrel_api_key,
+    nrel_api_email,
+    resource_dict,
+    config_dict,
+    resource_years,
+    input_dir,
+    tz_offset,
+):
+
+    resource = config_dict["Resource"]
+
     lon_lats = list(resource_dict.keys())
 
-    # this is the df that will hold all of the data for all years
-    df_resource = pd.DataFrame(data=range(1, 8761), columns=["timepoint"]).set_index(
-        "timepoint"
-    )
-    df_index = df_resource.index
+    # these are the columns of capacity factor data for all years, keyed
+    # by "<generator>~<year>"
+    resource_columns = {}
+
+    # cached simulation outputs are shared across gen sets, like the
+    # weather files themselves
+    cache_dir = input_dir.parent / "PySAM Simulation Cache"
+    os.makedirs(cache_dir, exist_ok=True)
 
     for year in resource_years:
 
         # specify wind data input
         wtkfetcher = tools.FetchResourceFiles(
             tech="wind",
-            workers=4,  # thread workers if fetching multiple files
+            # one thread worker per site (capped) so the HTTP requests to
+            # the NSRDB/WTK API run concurrently
+            workers=min(len(lon_lats), 16),
             nrel_api_key=nrel_api_key,
             nrel_api_email=nrel_api_email,
             resource_year=str(year),
             resource_height=resource["resource_height"],
-            resource_dir=(input_dir / "PySAM Downloaded Weather Files/Wind"),
+            # weather file cache shared across gen sets; see the solar
+            # fetcher for details
+            resource_dir=(input_dir.parent / "PySAM Downloaded Weather Files/Wind"),
             verbose=False,
         )
 
@@ -1639,53 +1818,46 @@ def simulate_wind_generation(
         # get a dictionary of all of the filepaths
         wtk_path_dict = wtkfetcher.resource_file_paths_dict
 
-        for filename in wtk_path_dict:
-            windResource = tools.SRW_to_wind_data(wtk_path_dict[filename])
-
-            # assign the wind resource input data to the model
-            system_model_wind.Resource.wind_resource_data = windResource
-
-            # execute the system model
-            system_model_wind.execute()
-
-            # access sytem power generated output
-            output = system_model_wind.Outputs.gen
-
-            df_output = pd.DataFrame(output)
-
-            # calculate capacity factor
-            df_output = df_output / farm["system_capacity"]
-
-            # name the column based on resource name
-            # check if the resource name is a list, meaning the profile belongs to several resources
-            if isinstance(resource_dict[filename], list):
-                # merge each resource
-                for gen in resource_dict[filename]:
-                    df_output_gen = df_output.copy().rename(
-                        columns={0: f"{gen}~{year}"}
-                    )
-
-                    # merge into the resource
-                    df_output_gen.index = df_index
-                    df_resource = df_resource.merge(
-                        df_output_gen, how="left", left_index=True, right_index=True
-                    )
-            else:
-                df_output = df_output.rename(
-                    columns={0: f"{resource_dict[filename]}~{year}"}
+        # the sites are independent, so simulate them in parallel worker
+        # processes; each worker builds its own PySAM model. Sites with
+        # a cached result from an earlier run are loaded from disk
+        # instead of being re-simulated
+        site_outputs = {}
+        with ProcessPoolExecutor() as site_pool:
+            site_futures = {}
+            for filename in wtk_path_dict:
+                cache_path = simulation_cache_path(
+                    cache_dir, wtk_path_dict[filename], config_dict
                 )
-
-                # merge into the resource
-                df_output.index = df_index
-                df_resource = df_resource.merge(
-                    df_output, how="left", left_index=True, right_index=True
+                if os.path.exists(cache_path):
+                    site_outputs[filename] = np.load(cache_path)
+                    continue
+                site_futures[filename] = (
+                    cache_path,
+                    site_pool.submit(
+                        simulate_wind_site, wtk_path_dict[filename], config_dict
+                    ),
                 )
 
-    # remove year from column name
-    # df_resource.columns = [i.split('~')[0] for i in df_resource.columns]
+            for filename, (cache_path, future) in site_futures.items():
+                output = future.result()
+                np.save(cache_path, output)
+                site_outputs[filename] = output
+
+            for filename, output in site_outputs.items():
 
-    # groupby column name
-    # df_resource = df_resource.groupby(df_resource.columns, axis=1).mean()
+                # name the column based on resource name
+                # check if the resource name is a list, meaning the profile belongs to several resources
+                if isinstance(resource_dict[filename], list):
+                    for gen in resource_dict[filename]:
+                        resource_columns[f"{gen}~{year}"] = output
+                else:
+                    resource_columns[f"{resource_dict[filename]}~{year}"] = output
+
+    # build the dataframe holding all of the data for all years
+    df_resource = pd.DataFrame(
+        resource_columns, index=pd.RangeIndex(1, 8761, name="timepoint")
+    )
 
     return df_resource
 
@@ -1715,11 +1887,15 @@ def simulate_csp_generation(
 
     lon_lats = list(resource_dict.keys())
 
-    # this is the df that will hold all of the data for all years
-    df_resource = pd.DataFrame(data=range(1, 8761), columns=["timepoint"]).set_index(
-        "timepoint"
-    )
-    df_index = df_resource.index
+    # these are the columns of capacity factor data for all years, keyed
+    # by "<generator>~<year>"; collecting plain arrays and building the
+    # dataframe once at the end avoids a merge per site per year
+    resource_columns = {}
+
+    # cached simulation outputs are shared across gen sets, like the
+    # weather files themselves
+    cache_dir = input_dir.parent / "PySAM Simulation Cache"
+    os.makedirs(cache_dir, exist_ok=True)
 
     for year in resource_years:
 
@@ -1729,12 +1905,16 @@ def simulate_csp_generation(
 
         nsrdbfetcher = tools.FetchResourceFiles(
             tech="solar",
-            workers=4,  # thread workers if fetching multiple files
+            # one thread worker per site (capped) so the HTTP requests to
+            # the NSRDB/WTK API run concurrently
+            workers=min(len(lon_lats), 16),
             nrel_api_key=nrel_api_key,
             resource_type="psm3",
             resource_year=str(year),
             nrel_api_email=nrel_api_email,
-            resource_dir=(input_dir / "PySAM Downloaded Weather Files/CSP"),
+            # weather file cache shared across gen sets; see the solar
+            # fetcher for details
+            resource_dir=(input_dir.parent / "PySAM Downloaded Weather Files/CSP"),
             verbose=False,
         )
 
@@ -1745,56 +1925,44 @@ def simulate_csp_generation(
         nsrdb_path_dict = nsrdbfetcher.resource_file_paths_dict
 
         for filename in nsrdb_path_dict:
-            # convert TMY data to be used in SAM
-            # solarResource = tools.SAM_CSV_to_solar_data(nsrdb_path_dict[filename])
-
-            # assign the solar resource input file to the model
-            # system_model_MSPT.SolarResource.solar_resource_data = solarResource
-            system_model_MSPT.SolarResource.solar_resource_file = nsrdb_path_dict[
-                filename
-            ]
+            # CSP simulations take several seconds each, so re-use the
+            # output from an earlier run when one is cached
+            cache_path = simulation_cache_path(
+                cache_dir, nsrdb_path_dict[filename], config_dict
+            )
+            if os.path.exists(cache_path):
+                output = np.load(cache_path)
+            else:
+                # convert TMY data to be used in SAM
+                # solarResource = tools.SAM_CSV_to_solar_data(nsrdb_path_dict[filename])
 
-            # execute the system model
-            system_model_MSPT.execute()
+                # assign the solar resource input file to the model
+                # system_model_MSPT.SolarResource.solar_resource_data = solarResource
+                system_model_MSPT.SolarResource.solar_resource_file = nsrdb_path_dict[
+                    filename
+                ]
 
-            # access sytem power generated output
-            output = system_model_MSPT.Outputs.gen
+                # execute the system model
+                system_model_MSPT.execute()
 
-            # roll the data to get into pacific time
-            df_output = pd.DataFrame(output)
+                # access sytem power generated output
+                output = np.asarray(system_model_MSPT.Outputs.gen)
+                np.save(cache_path, output)
 
             # calculate capacity factor
-            df_output = df_output / (systemDesign["P_ref"] * 1000)
+            output = output / (systemDesign["P_ref"] * 1000)
 
             # name the column based on resource name
             # check if the resource name is a list, meaning the profile belongs to several resources
             if isinstance(resource_dict[filename], list):
-                # merge each resource
                 for gen in resource_dict[filename]:
-                    df_output_gen = df_output.copy().rename(
-                        columns={0: f"{gen}~{year}"}
-                    )
-
-                    # merge into the resource
-                    df_output_gen.index = df_index
-                    df_resource = df_resource.merge(
-                        df_output_gen, how="left", left_index=True, right_index=True
-                    )
+                    resource_columns[f"{gen}~{year}"] = output
             else:
-                df_output = df_output.rename(
-                    columns={0: f"{resource_dict[filename]}~{year}"}
-                )
-
-                # merge into the resource
-                df_output.index = df_index
-                df_resource = df_resource.merge(
-                    df_output, how="left", left_index=True, right_index=True
-                )
-
-    # remove year from column name
-    # df_resource.columns = [i.split('~')[0] for i in df_resource.columns]
+                resource_columns[f"{resource_dict[filename]}~{year}"] = output
 
-    # groupby column name
-    # df_resource = df_resource.groupby(df_resource.columns, axis=1).mean()
+    # build the dataframe holding all of the data for all years
+    df_resource = pd.DataFrame(
+        resource_columns, index=pd.RangeIndex(1, 8761, name="timepoint")
+    )
 
     return df_resource
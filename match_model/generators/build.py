@@ -291,6 +291,10 @@ def define_components(mod):
             g for g in m.GENS_IN_ZONE[z] if not m.gen_is_storage[g]
         ],
     )
+    mod.VARIABLE_GENS_IN_ZONE = Set(
+        mod.LOAD_ZONES,
+        initialize=lambda m, z: [g for g in m.GENS_IN_ZONE[z] if m.gen_is_variable[g]],
+    )
 
     def GENS_BY_TECHNOLOGY_init(m, t):
         if not hasattr(m, "GENS_BY_TECH_dict"):
@@ -359,16 +363,23 @@ def define_components(mod):
         ],
     )
 
-    def bounds_BuildGen(model, g, bld_yr):
-        if (g, bld_yr) in model.PREDETERMINED_GEN_BLD_YRS:
-            return (
-                model.gen_predetermined_cap[g, bld_yr],
-                model.gen_capacity_limit_mw[g],
-            )
-        else:
-            return (0, model.gen_capacity_limit_mw[g])
+    mod.BuildGen = Var(mod.GEN_BLD_YRS, within=NonNegativeReals)
 
-    mod.BuildGen = Var(mod.GEN_BLD_YRS, within=NonNegativeReals, bounds=bounds_BuildGen)
+    # Set the bounds on BuildGen in a single pass over the variable rather
+    # than with a bounds= rule, which would look up the predetermined set
+    # membership and capacity limit separately for every (g, bld_yr).
+    def BuildGen_assign_bounds(m):
+        predetermined_cap = m.gen_predetermined_cap.extract_values()
+        capacity_limit = m.gen_capacity_limit_mw.extract_values()
+        predetermined_bld_yrs = set(m.PREDETERMINED_GEN_BLD_YRS)
+        for (g, bld_yr), v in m.BuildGen.items():
+            if (g, bld_yr) in predetermined_bld_yrs:
+                v.setlb(predetermined_cap[g, bld_yr])
+            else:
+                v.setlb(0)
+            v.setub(capacity_limit[g])
+
+    mod.BuildGen_assign_bounds = BuildAction(rule=BuildGen_assign_bounds)
     # Some projects are retired before the first study period, so they
     # don't appear in the objective function or any constraints.
     # In this case, pyomo may leave the variable value undefined even
@@ -395,9 +406,9 @@ def define_components(mod):
     # and 'C-Coal_ST' in m.GENS_IN_PERIOD[2020] and 'C-Coal_ST' not in m.GENS_IN_PERIOD[2030]
     mod.GEN_PERIODS = Set(
         dimen=2,
-        initialize=lambda m: [
+        initialize=lambda m: (
             (g, p) for g in m.GENERATION_PROJECTS for p in m.PERIODS_FOR_GEN[g]
-        ],
+        ),
     )
 
     mod.GenCapacity = Expression(
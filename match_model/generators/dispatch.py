@@ -164,6 +164,24 @@ def define_components(mod):
         doc="The set of projects active in a given period.",
     )
 
+    # intersect GENS_IN_PERIOD with the generator-type subsets once, so
+    # the per-timepoint cost expressions below don't repeat a membership
+    # test for every generator in every timepoint
+    mod.NON_STORAGE_GENS_IN_PERIOD = Set(
+        mod.PERIODS,
+        initialize=lambda m, p: [
+            g for g in m.GENS_IN_PERIOD[p] if g in m.NON_STORAGE_GENS
+        ],
+        ordered=False,
+        doc="The set of non-storage projects active in a given period.",
+    )
+    mod.VARIABLE_GENS_IN_PERIOD = Set(
+        mod.PERIODS,
+        initialize=lambda m, p: [g for g in m.GENS_IN_PERIOD[p] if g in m.VARIABLE_GENS],
+        ordered=False,
+        doc="The set of variable projects active in a given period.",
+    )
+
     mod.TPS_FOR_GEN = Set(
         mod.GENERATION_PROJECTS,
         within=mod.TIMEPOINTS,
@@ -250,8 +268,8 @@ def define_components(mod):
         mod.TIMEPOINTS,
         rule=lambda m, z, t: sum(
             m.DispatchGen[g, t]
-            for g in m.GENS_IN_ZONE[z]
-            if (g, t) in m.NON_STORAGE_GEN_TPS
+            for g in m.NON_STORAGE_GENS_IN_ZONE[z]
+            if g in m.NON_STORAGE_GENS_IN_PERIOD[m.tp_period[t]]
         ),
         doc="Generation from generation projects.",
     )
@@ -261,8 +279,7 @@ def define_components(mod):
         mod.TIMEPOINTS,
         rule=lambda m, t: sum(
             m.DispatchGen[g, t] * (m.ppa_energy_cost[g])
-            for g in m.GENS_IN_PERIOD[m.tp_period[t]]
-            if g in m.NON_STORAGE_GENS
+            for g in m.NON_STORAGE_GENS_IN_PERIOD[m.tp_period[t]]
         ),
         doc="Summarize costs for the objective function",
     )
@@ -292,8 +309,7 @@ def define_components(mod):
         mod.TIMEPOINTS,
         rule=lambda m, t: sum(
             m.CurtailGen[g, t] * (m.ppa_energy_cost[g])
-            for g in m.GENS_IN_PERIOD[m.tp_period[t]]
-            if g in m.VARIABLE_GENS
+            for g in m.VARIABLE_GENS_IN_PERIOD[m.tp_period[t]]
         ),
         doc="Summarize costs for the objective function",
     )
@@ -304,8 +320,8 @@ def define_components(mod):
         mod.TIMEPOINTS,
         rule=lambda m, z, t: sum(
             m.CurtailGen[g, t]
-            for g in m.GENS_IN_ZONE[z]
-            if (g, t) in m.VARIABLE_GEN_TPS
+            for g in m.VARIABLE_GENS_IN_ZONE[z]
+            if g in m.VARIABLE_GENS_IN_PERIOD[m.tp_period[t]]
         ),
         doc="Curtailment from variable generation projects.",
     )
@@ -313,14 +329,23 @@ def define_components(mod):
     # DISPATCH UPPER LIMITS
     #######################
 
+    def gen_type_sets(m):
+        # cache the type subsets as plain Python sets, so the rules below
+        # don't pay Pyomo's Set membership overhead for every (gen,
+        # timepoint) pair during model construction
+        if not hasattr(m, "gen_type_sets_cache"):
+            m.gen_type_sets_cache = (set(m.VARIABLE_GENS), set(m.BASELOAD_GENS))
+        return m.gen_type_sets_cache
+
     def DispatchUpperLimit_expr(m, g, t):
-        if g in m.VARIABLE_GENS:
+        variable_gens, baseload_gens = gen_type_sets(m)
+        if g in variable_gens:
             return (
                 m.GenCapacityInTP[g, t]
                 * m.gen_availability[g]
                 * m.variable_capacity_factor[g, t]
             )
-        elif g in m.BASELOAD_GENS:
+        elif g in baseload_gens:
             return (
                 m.GenCapacityInTP[g, t]
                 * m.gen_availability[g]
@@ -334,11 +359,12 @@ def define_components(mod):
     )
 
     def EnforceDispatchUpperLimit_rule(m, g, t):
-        if g in m.VARIABLE_GENS:
+        variable_gens, baseload_gens = gen_type_sets(m)
+        if g in variable_gens:
             return (
                 m.DispatchGen[g, t] + m.CurtailGen[g, t] <= m.DispatchUpperLimit[g, t]
             )
-        elif g in m.BASELOAD_GENS:
+        elif g in baseload_gens:
             return m.DispatchGen[g, t] == m.DispatchUpperLimit[g, t]
         else:
             return m.DispatchGen[g, t] <= m.DispatchUpperLimit[g, t]
@@ -350,7 +376,8 @@ def define_components(mod):
     # EXCESS GENERATION
     ###################
     def ExcessGen_rule(m, g, t):
-        if g in m.VARIABLE_GENS:
+        variable_gens, _ = gen_type_sets(m)
+        if g in variable_gens:
             return m.DispatchUpperLimit[g, t] - m.DispatchGen[g, t] - m.CurtailGen[g, t]
         else:
             return m.DispatchUpperLimit[g, t] - m.DispatchGen[g, t]
@@ -367,26 +394,23 @@ def define_components(mod):
     mod.AnnualTotalGen = Expression(
         mod.NON_STORAGE_GENS,
         mod.PERIODS,
-        rule=lambda m, g, p: sum(
-            m.TotalGen[g, t] for t in m.TIMEPOINTS if m.tp_period[t] == p
+        rule=lambda m, g, p: quicksum(
+            m.TotalGen[g, t] for t in m.TPS_IN_PERIOD[p]
         ),
     )
 
     mod.ZoneTotalExcessGen = Expression(
         mod.ZONE_TIMEPOINTS,
         rule=lambda m, z, t: sum(
-            m.ExcessGen[g, t] for g in m.GENS_IN_ZONE[z] if (g, t) in m.VARIABLE_GEN_TPS
+            m.ExcessGen[g, t]
+            for g in m.VARIABLE_GENS_IN_ZONE[z]
+            if g in m.VARIABLE_GENS_IN_PERIOD[m.tp_period[t]]
         ),
     )
 
     # calculate the total excess energy for each variable generator in each period
     def Calculate_Annual_Excess_Energy_By_Gen(m, g, p):
-        excess = sum(
-            m.ExcessGen[g, t]
-            for t in m.TIMEPOINTS  # for each timepoint
-            if m.tp_period[t]
-            == p  # if the timepoint is in the current period and the generator is variable
-        )
+        excess = quicksum(m.ExcessGen[g, t] for t in m.TPS_IN_PERIOD[p])
         return excess
 
     mod.AnnualExcessGen = Expression(
@@ -399,8 +423,7 @@ def define_components(mod):
         mod.TIMEPOINTS,
         rule=lambda m, t: sum(
             m.ExcessGen[g, t] * (m.ppa_energy_cost[g])
-            for g in m.GENS_IN_PERIOD[m.tp_period[t]]
-            if g in m.VARIABLE_GENS
+            for g in m.VARIABLE_GENS_IN_PERIOD[m.tp_period[t]]
         ),
         doc="Summarize costs for the objective function",
     )
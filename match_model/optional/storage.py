@@ -133,9 +133,9 @@ def define_components(mod):
     )
     mod.STORAGE_GEN_PERIODS = Set(
         within=mod.GEN_PERIODS,
-        initialize=lambda m: [
+        initialize=lambda m: (
             (g, p) for g in m.STORAGE_GENS for p in m.PERIODS_FOR_GEN[g]
-        ],
+        ),
     )
 
     mod.STORAGE_GEN_TPS = Set(
@@ -217,22 +217,33 @@ def define_components(mod):
 
     mod.BuildStorageEnergy = Var(mod.STORAGE_GEN_BLD_YRS, within=NonNegativeReals)
 
+    # most projects leave these ratio parameters unspecified, so restrict
+    # each constraint's index set to the projects with a value rather than
+    # returning Constraint.Skip for every other (gen, bld_yr) pair
+    mod.MIN_HYBRID_RATIO_GEN_BLD_YRS = Set(
+        dimen=2,
+        initialize=mod.STORAGE_GEN_BLD_YRS,
+        filter=lambda m, g, y: m.storage_hybrid_min_capacity_ratio[g] != float("inf"),
+    )
+
     mod.Enforce_Minimum_Hybrid_Build = Constraint(
-        mod.STORAGE_GEN_BLD_YRS,
-        rule=lambda m, g, y: Constraint.Skip
-        if m.storage_hybrid_min_capacity_ratio[g] == float("inf")  # no value specified
-        else (
+        mod.MIN_HYBRID_RATIO_GEN_BLD_YRS,
+        rule=lambda m, g, y: (
             m.BuildGen[g, y]
             >= m.storage_hybrid_min_capacity_ratio[g]
             * m.BuildGen[m.storage_hybrid_generation_project[g], y]
         ),
     )
 
+    mod.MAX_HYBRID_RATIO_GEN_BLD_YRS = Set(
+        dimen=2,
+        initialize=mod.STORAGE_GEN_BLD_YRS,
+        filter=lambda m, g, y: m.storage_hybrid_max_capacity_ratio[g] != float("inf"),
+    )
+
     mod.Enforce_Maximum_Hybrid_Build = Constraint(
-        mod.STORAGE_GEN_BLD_YRS,
-        rule=lambda m, g, y: Constraint.Skip
-        if m.storage_hybrid_max_capacity_ratio[g] == float("inf")  # no value specified
-        else (
+        mod.MAX_HYBRID_RATIO_GEN_BLD_YRS,
+        rule=lambda m, g, y: (
             m.BuildGen[g, y]
             <= m.storage_hybrid_max_capacity_ratio[g]
             * m.BuildGen[m.storage_hybrid_generation_project[g], y]
@@ -249,11 +260,15 @@ def define_components(mod):
     )
 
     # use fixed energy/power ratio (# hours of capacity) when specified
+    mod.FIXED_RATIO_STORAGE_GEN_BLD_YRS = Set(
+        dimen=2,
+        initialize=mod.STORAGE_GEN_BLD_YRS,
+        filter=lambda m, g, y: m.storage_energy_to_power_ratio[g] != float("inf"),
+    )
+
     mod.Enforce_Fixed_Energy_Storage_Ratio = Constraint(
-        mod.STORAGE_GEN_BLD_YRS,
-        rule=lambda m, g, y: Constraint.Skip
-        if m.storage_energy_to_power_ratio[g] == float("inf")  # no value specified
-        else (
+        mod.FIXED_RATIO_STORAGE_GEN_BLD_YRS,
+        rule=lambda m, g, y: (
             m.BuildStorageEnergy[g, y]
             == m.storage_energy_to_power_ratio[g] * m.BuildGen[g, y]
         ),
@@ -389,7 +404,7 @@ def define_components(mod):
     ##############
     mod.Battery_Cycle_Count = Expression(
         mod.STORAGE_GEN_PERIODS,
-        rule=lambda m, g, p: sum(
+        rule=lambda m, g, p: quicksum(
             m.DischargeStorage[g, t]
             / sqrt(m.storage_roundtrip_efficiency[g])
             * m.tp_duration_hrs[t]
@@ -397,14 +412,18 @@ def define_components(mod):
         ),
     )
 
+    # solvers sometimes perform badly with infinite constraints, so only
+    # build the limit for projects with a cycle limit specified
+    mod.CYCLE_LIMITED_STORAGE_GEN_PERIODS = Set(
+        dimen=2,
+        initialize=mod.STORAGE_GEN_PERIODS,
+        filter=lambda m, g, p: m.storage_max_annual_cycles[g] != float("inf"),
+    )
+
     # batteries can only complete the specified number of cycles per year, averaged over each period
     mod.Battery_Cycle_Limit = Constraint(
-        mod.STORAGE_GEN_PERIODS,
-        rule=lambda m, g, p:
-        # solvers sometimes perform badly with infinite constraint
-        Constraint.Skip
-        if m.storage_max_annual_cycles[g] == float("inf")
-        else (
+        mod.CYCLE_LIMITED_STORAGE_GEN_PERIODS,
+        rule=lambda m, g, p: (
             m.Battery_Cycle_Count[g, p]
             <= m.storage_max_annual_cycles[g]
             * m.StorageEnergyCapacity[g, p]
@@ -2,7 +2,7 @@
 # Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE Version 3 (or later), which is in the LICENSE file.
 
 import os
-import shutil
+import subprocess
 
 
 def post_solve(instance, outdir, inputs_dir):
@@ -14,20 +14,41 @@ def post_solve(instance, outdir, inputs_dir):
 
     # shutil.copy('../reporting/summary_report.ipynb', inputs_dir)
 
+    notebook = f"{inputs_dir}/summary_report.ipynb"
+
     # run the notebook
+    execute_command = [
+        "jupyter",
+        "nbconvert",
+        "--ExecutePreprocessor.kernel_name=python3",
+        "--to",
+        "notebook",
+        "--execute",
+        "--inplace",
+        notebook,
+    ]
     try:
-        os.system(
-            f'jupyter nbconvert --ExecutePreprocessor.kernel_name="python3" --to notebook --execute --inplace {inputs_dir}/summary_report.ipynb'
-        )
+        subprocess.run(execute_command, check=True)
     # if the kernel doesnt respond, try re-running the notebook
-    except RuntimeError:
+    except subprocess.CalledProcessError:
         print("Jupyter Kernel did not respond, retrying running the notebook")
-        os.system(
-            f'jupyter nbconvert --ExecutePreprocessor.kernel_name="python3" --to notebook --execute --inplace {inputs_dir}/summary_report.ipynb'
-        )
+        subprocess.run(execute_command, check=True)
     # convert the notebook to html and save it to the output directory
-    os.system(
-        f"jupyter nbconvert --to html --no-input --no-prompt {inputs_dir}/summary_report.ipynb --output-dir {outdir}/../../summary_reports --output summary_report_{scenario}"
+    subprocess.run(
+        [
+            "jupyter",
+            "nbconvert",
+            "--to",
+            "html",
+            "--no-input",
+            "--no-prompt",
+            notebook,
+            "--output-dir",
+            f"{outdir}/../../summary_reports",
+            "--output",
+            f"summary_report_{scenario}",
+        ],
+        check=True,
     )
     # delete the notebook from the inputs directory
-    os.remove(f"{inputs_dir}/summary_report.ipynb")
+    os.remove(notebook)
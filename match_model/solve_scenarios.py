@@ -25,6 +25,7 @@ from __future__ import print_function, absolute_import
 import sys, os, time
 import argparse, shlex, socket, io, glob
 from collections import OrderedDict
+from pathlib import Path
 import pandas as pd
 
 from .utilities import _ArgumentParser
@@ -176,12 +177,17 @@ def main(args=None):
         mark_completed(scenario_name)
 
     if len(running_scenarios) == 0:
-        # check that all scenarios have been run and outputs completed
-        scenarios = os.listdir("outputs")
+        # check that all scenarios have been run and outputs completed,
+        # listing the output directory once and reusing the per-scenario
+        # paths throughout the comparison below
+        outputs_dir = Path("outputs")
+        inputs_dir = Path("inputs")
+        summary_reports_dir = Path("summary_reports")
+        scenarios = [p.name for p in outputs_dir.iterdir()]
         all_done = []
         for s in scenarios:
-            summary_file = f"summary_reports/summary_report_{s}.html"
-            if os.path.exists(summary_file):
+            summary_file = summary_reports_dir / f"summary_report_{s}.html"
+            if summary_file.exists():
                 all_done.append(True)
             else:
                 all_done.append(False)
@@ -191,60 +197,62 @@ def main(args=None):
             # run the comparison reports for all of the scenarios once run
             print("Generating scenario comparison reports.")
 
-            i = 0
+            # collect the per-scenario tables in lists and combine them
+            # with a single outer concat, rather than re-merging the
+            # accumulated dataframe for every scenario
+            summary_parts = []
+            summary_files = []
+            capacity_parts = []
             for s in scenarios:
-                summary_file = f"summary_reports/scenario_summary_{s}.csv"
-                capacity_file = f"outputs/{s}/gen_cap.csv"
-                predetermined = f"inputs/{s}/gen_build_predetermined.csv"
+                summary_file = summary_reports_dir / f"scenario_summary_{s}.csv"
+                summary_files.append(summary_file)
+                capacity_file = outputs_dir / s / "gen_cap.csv"
+                predetermined = inputs_dir / s / "gen_build_predetermined.csv"
                 predetermined_list = list(
-                    pd.read_csv(predetermined, usecols=["GENERATION_PROJECT"])[
-                        "GENERATION_PROJECT"
-                    ]
+                    pd.read_csv(
+                        predetermined,
+                        usecols=["GENERATION_PROJECT"],
+                        dtype={"GENERATION_PROJECT": str},
+                    )["GENERATION_PROJECT"]
                 )
 
-                if i == 0:
-                    summary_df = pd.read_csv(summary_file, index_col=0)
-                    capacity_df = pd.read_csv(
-                        capacity_file,
-                        usecols=["generation_project", "gen_tech", "GenCapacity"],
-                    ).rename(columns={"GenCapacity": s})
-                    capacity_df["predetermined"] = "No"
-                    capacity_df.loc[
-                        capacity_df["generation_project"].isin(predetermined_list),
-                        "predetermined",
-                    ] = "Yes"
-
-                    i += 1
-                else:
-                    summary_df2 = pd.read_csv(summary_file, index_col=0)
-                    summary_df = summary_df.merge(
-                        summary_df2, how="outer", left_index=True, right_index=True
+                # the summary rows mix labels and numbers, so read them
+                # as text rather than letting pandas infer a dtype per
+                # column; the values are only re-written to csv
+                summary_parts.append(pd.read_csv(summary_file, index_col=0, dtype=str))
+
+                scenario_capacity = pd.read_csv(
+                    capacity_file,
+                    usecols=["generation_project", "gen_tech", "GenCapacity"],
+                    dtype={
+                        "generation_project": str,
+                        "gen_tech": str,
+                        "GenCapacity": float,
+                    },
+                ).rename(columns={"GenCapacity": s})
+                scenario_capacity["predetermined"] = "No"
+                scenario_capacity.loc[
+                    scenario_capacity["generation_project"].isin(predetermined_list),
+                    "predetermined",
+                ] = "Yes"
+                capacity_parts.append(
+                    scenario_capacity.set_index(
+                        ["generation_project", "gen_tech", "predetermined"]
                     )
+                )
 
-                    capacity_df2 = pd.read_csv(
-                        capacity_file,
-                        usecols=["generation_project", "gen_tech", "GenCapacity"],
-                    ).rename(columns={"GenCapacity": s})
-                    capacity_df2["predetermined"] = "No"
-                    capacity_df2.loc[
-                        capacity_df2["generation_project"].isin(predetermined_list),
-                        "predetermined",
-                    ] = "Yes"
-
-                    capacity_df = capacity_df.merge(
-                        capacity_df2,
-                        how="outer",
-                        on=["generation_project", "gen_tech", "predetermined"],
-                    )
+            summary_df = pd.concat(summary_parts, axis=1)
+            capacity_df = pd.concat(capacity_parts, axis=1).reset_index()
 
             summary_df.columns = summary_df.loc["Scenario Name", :]
             summary_df = summary_df.drop(index="Scenario Name")
-            summary_df.to_csv("summary_reports/scenario_comparison.csv")
-            capacity_df.to_csv("summary_reports/portfolio_comparison.csv", index=False)
+            summary_df.to_csv(summary_reports_dir / "scenario_comparison.csv")
+            capacity_df.to_csv(
+                summary_reports_dir / "portfolio_comparison.csv", index=False
+            )
 
             # delete all of the individual files
-            for s in scenarios:
-                summary_file = f"summary_reports/scenario_summary_{s}.csv"
+            for summary_file in summary_files:
                 os.remove(summary_file)
 
 
@@ -257,11 +257,20 @@ def define_components(mod):
     mod.MONTHS = Set(
         ordered=True, initialize=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], dimen=1
     )
-    mod.DAYS = Set(ordered=True, initialize=range(1, 366))
 
-    # specify which month each timepoint is associated with
+    # specify which month and day of year each timepoint is associated with
     mod.tp_month = Param(mod.TIMEPOINTS, within=mod.MONTHS)
-    mod.tp_day = Param(mod.TIMEPOINTS, within=mod.DAYS)
+    mod.tp_day = Param(
+        mod.TIMEPOINTS,
+        within=PositiveIntegers,
+        validate=lambda m, val, t: val <= 365,
+    )
+
+    # only include days that actually occur in TIMEPOINTS, so that any
+    # components indexed over DAYS are not declared for unused days
+    mod.DAYS = Set(
+        ordered=True, initialize=lambda m: sorted(set(m.tp_day.values()))
+    )
 
     # Derived sets and parameters
     # note: the first five are calculated early so they
@@ -277,28 +286,71 @@ def define_components(mod):
             m.tp_duration_hrs[t] * m.ts_scale_to_period[m.tp_ts[t]]
         ),
     )
+    """Construct the indexed timepoint and timeseries sets with a
+    'construction dictionary' pattern: on the first call, make a single
+    traversal through all timepoints (or timeseries) to bin them by key,
+    use that for subsequent lookups, and clean up at the last call. This
+    avoids re-scanning TIMEPOINTS once per timeseries or period."""
+
+    def TPS_IN_TS_init(m, ts):
+        if not hasattr(m, "TPS_IN_TS_dict"):
+            m.TPS_IN_TS_dict = {_ts: [] for _ts in m.TIMESERIES}
+            # read the param through a plain dict to skip Pyomo's
+            # __getitem__ machinery on every timepoint
+            tp_ts = m.tp_ts.extract_values()
+            for t in m.TIMEPOINTS:
+                m.TPS_IN_TS_dict[tp_ts[t]].append(t)
+        result = m.TPS_IN_TS_dict.pop(ts)
+        if not m.TPS_IN_TS_dict:
+            del m.TPS_IN_TS_dict
+        return result
+
     mod.TPS_IN_TS = Set(
         mod.TIMESERIES,
         ordered=True,
         within=mod.TIMEPOINTS,
-        initialize=lambda m, ts: [t for t in m.TIMEPOINTS if m.tp_ts[t] == ts],
+        initialize=TPS_IN_TS_init,
     )
     mod.tp_period = Param(
         mod.TIMEPOINTS,
         within=mod.PERIODS,
         initialize=lambda m, t: m.ts_period[m.tp_ts[t]],
     )
+
+    def TS_IN_PERIOD_init(m, p):
+        if not hasattr(m, "TS_IN_PERIOD_dict"):
+            m.TS_IN_PERIOD_dict = {_p: [] for _p in m.PERIODS}
+            ts_period = m.ts_period.extract_values()
+            for ts in m.TIMESERIES:
+                m.TS_IN_PERIOD_dict[ts_period[ts]].append(ts)
+        result = m.TS_IN_PERIOD_dict.pop(p)
+        if not m.TS_IN_PERIOD_dict:
+            del m.TS_IN_PERIOD_dict
+        return result
+
     mod.TS_IN_PERIOD = Set(
         mod.PERIODS,
         ordered=True,
         within=mod.TIMESERIES,
-        initialize=lambda m, p: [ts for ts in m.TIMESERIES if m.ts_period[ts] == p],
+        initialize=TS_IN_PERIOD_init,
     )
+
+    def TPS_IN_PERIOD_init(m, p):
+        if not hasattr(m, "TPS_IN_PERIOD_dict"):
+            m.TPS_IN_PERIOD_dict = {_p: [] for _p in m.PERIODS}
+            tp_period = m.tp_period.extract_values()
+            for t in m.TIMEPOINTS:
+                m.TPS_IN_PERIOD_dict[tp_period[t]].append(t)
+        result = m.TPS_IN_PERIOD_dict.pop(p)
+        if not m.TPS_IN_PERIOD_dict:
+            del m.TPS_IN_PERIOD_dict
+        return result
+
     mod.TPS_IN_PERIOD = Set(
         mod.PERIODS,
         ordered=True,
         within=mod.TIMEPOINTS,
-        initialize=lambda m, p: [t for t in m.TIMEPOINTS if m.tp_period[t] == p],
+        initialize=TPS_IN_PERIOD_init,
     )
 
     # Decide whether period_end values have been given as exact points in time